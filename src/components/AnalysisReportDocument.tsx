@@ -4,35 +4,28 @@ import type { AnalysisReport } from '@/types/analysis';
 import { Badge } from './ui/badge';
 import { Separator } from './ui/separator';
 
+// Classification lookups, built once at module load instead of per render
+const PRIORITY_ICONS: Record<string, JSX.Element> = {
+  high: <AlertCircle className="h-4 w-4 text-red-500" />,
+  moderate: <AlertTriangle className="h-4 w-4 text-yellow-500" />,
+};
+const DEFAULT_PRIORITY_ICON = <CheckCircle2 className="h-4 w-4 text-green-500" />;
+
+const RISK_BADGE_VARIANTS: Record<string, 'destructive' | 'secondary'> = {
+  critical: 'destructive',
+  high: 'destructive',
+  moderate: 'secondary',
+};
+
+const getPriorityIcon = (priority: string) => PRIORITY_ICONS[priority] ?? DEFAULT_PRIORITY_ICON;
+
+const getRiskBadgeVariant = (level: string) => RISK_BADGE_VARIANTS[level] ?? 'outline';
+
 interface AnalysisReportDocumentProps {
   report: AnalysisReport;
 }
 
 export function AnalysisReportDocument({ report }: AnalysisReportDocumentProps) {
-  const getPriorityIcon = (priority: string) => {
-    switch (priority) {
-      case 'high':
-        return <AlertCircle className="h-4 w-4 text-red-500" />;
-      case 'moderate':
-        return <AlertTriangle className="h-4 w-4 text-yellow-500" />;
-      default:
-        return <CheckCircle2 className="h-4 w-4 text-green-500" />;
-    }
-  };
-
-  const getRiskBadgeVariant = (level: string) => {
-    switch (level) {
-      case 'critical':
-        return 'destructive';
-      case 'high':
-        return 'destructive';
-      case 'moderate':
-        return 'secondary';
-      default:
-        return 'outline';
-    }
-  };
-
   return (
     <div id="report-document" className="report-document bg-card border border-border rounded-lg p-4 sm:p-6 lg:p-8">
       {/* Header - Medical Letterhead Style */}
@@ -17,7 +17,7 @@ import { toast as sonnerToast } from 'sonner';
 
 interface EditPatientDialogProps {
   patient: Patient;
-  onSuccess?: () => void;
+  onSuccess?: (updated: Patient) => void;
 }
 
 export const EditPatientDialog = memo(({ patient, onSuccess }: EditPatientDialogProps) => {
@@ -60,12 +60,12 @@ export const EditPatientDialog = memo(({ patient, onSuccess }: EditPatientDialog
         risk_level: formData.riskLevel,
       };
 
-      await patientService.updatePatient(patient.id, updates);
+      const updated = await patientService.updatePatient(patient.id, updates);
       logger.info('Patient updated successfully', { patientId: patient.id });
       
       sonnerToast.success('Patient updated successfully');
       setOpen(false);
-      onSuccess?.();
+      onSuccess?.(updated);
     } catch (error: any) {
       logger.error('Failed to update patient', error);
       sonnerToast.error(error.response?.data?.detail || 'Failed to update patient');
@@ -16,7 +16,6 @@ import { logger } from '@/utils/logger';
 import { Badge } from '@/components/ui/badge';
 import { EditMedicationDialog } from './EditMedicationDialog';
 import { RefillMedicationDialog } from './RefillMedicationDialog';
-import { exportPrescriptionsPDF } from '@/utils/pdfExport';
 
 interface MedicationTableProps {
   patientId: string;
@@ -52,8 +51,10 @@ export const MedicationTable = memo(({ patientId, patient, medications, onUpdate
     setEditDialogOpen(true);
   };
 
-  const handleExportPDF = () => {
+  const handleExportPDF = async () => {
     try {
+      // jsPDF is large and only needed here, so load it on first export
+      const { exportPrescriptionsPDF } = await import('@/utils/pdfExport');
       exportPrescriptionsPDF(patient, medications);
       toast.success('Prescriptions exported to PDF');
     } catch (error) {
@@ -1,4 +1,4 @@
-import { useState, useEffect } from 'react';
+import { useState, useEffect, useMemo } from 'react';
 import { Button } from './ui/button';
 import { Dialog, DialogContent, DialogDescription, DialogHeader, DialogTitle, DialogTrigger } from './ui/dialog';
 import { Input } from './ui/input';
@@ -13,7 +13,6 @@ import { Badge } from './ui/badge';
 export function PreviousReportsDialog() {
   const [open, setOpen] = useState(false);
   const [reports, setReports] = useState<AnalysisReport[]>([]);
-  const [filteredReports, setFilteredReports] = useState<AnalysisReport[]>([]);
   const [searchQuery, setSearchQuery] = useState('');
   const [isLoading, setIsLoading] = useState(false);
   const [downloadingId, setDownloadingId] = useState<string | null>(null);
@@ -24,28 +23,32 @@ export function PreviousReportsDialog() {
     }
   }, [open]);
 
-  useEffect(() => {
-    if (!searchQuery) {
-      setFilteredReports(reports);
-      return;
-    }
+  // Lower-case the searchable fields once per report list rather than for
+  // every report on every keystroke
+  const searchIndex = useMemo(
+    () => reports.map((report) => ({
+      report,
+      haystack: [report.patient.name, report.reportId, report.patient.id]
+        .join('\n')
+        .toLowerCase(),
+    })),
+    [reports]
+  );
 
+  const filteredReports = useMemo(() => {
     const query = searchQuery.toLowerCase();
-    const filtered = reports.filter(
-      (report) =>
-        report.patient.name.toLowerCase().includes(query) ||
-        report.reportId.toLowerCase().includes(query) ||
-        report.patient.id.toLowerCase().includes(query)
-    );
-    setFilteredReports(filtered);
-  }, [searchQuery, reports]);
+    if (!query) return reports;
+
+    return searchIndex
+      .filter((entry) => entry.haystack.includes(query))
+      .map((entry) => entry.report);
+  }, [searchQuery, reports, searchIndex]);
 
   const loadReports = async () => {
     setIsLoading(true);
     try {
       const data = await aiAnalysisService.listReports();
       setReports(data);
-      setFilteredReports(data);
     } catch (error) {
       console.error('Failed to load reports:', error);
       toast.error('Failed to load previous reports');
@@ -8,7 +8,6 @@ import { Visit, Patient } from '@/types/patient';
 import { ChevronDown, ChevronRight, Calendar, User, FileText, Download } from 'lucide-react';
 import { format } from 'date-fns';
 import { AddVisitDialog } from './AddVisitDialog';
-import { exportVisitHistoryPDF } from '@/utils/pdfExport';
 import { toast } from 'sonner';
 
 interface VisitHistoryTableProps {
@@ -21,8 +20,10 @@ interface VisitHistoryTableProps {
 export const VisitHistoryTable = memo(({ patientId, patient, visits, onUpdate }: VisitHistoryTableProps) => {
   const [expandedVisit, setExpandedVisit] = useState<string | null>(null);
 
-  const handleExportPDF = () => {
+  const handleExportPDF = async () => {
     try {
+      // jsPDF is large and only needed here, so load it on first export
+      const { exportVisitHistoryPDF } = await import('@/utils/pdfExport');
       exportVisitHistoryPDF(patient, visits);
       toast.success('Visit history exported to PDF');
     } catch (error) {
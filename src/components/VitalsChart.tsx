@@ -5,7 +5,7 @@ import { LineChart, Line, XAxis, YAxis, CartesianGrid, Tooltip, ResponsiveContai
 import { Vitals } from '@/types/patient';
 import { format } from 'date-fns';
 
-type ChartDataKey = 'heartRate' | 'oxygenSaturation' | 'temperature' | 'systolic' | 'diastolic' | 'glucose' | 'bloodGlucose';
+export type ChartDataKey = 'heartRate' | 'oxygenSaturation' | 'temperature' | 'systolic' | 'diastolic' | 'glucose' | 'bloodGlucose';
 
 interface VitalsChartProps {
   vitals: Vitals[];
@@ -13,36 +13,52 @@ interface VitalsChartProps {
   height?: number;
 }
 
+const LINE_CONFIG: Record<ChartDataKey, { stroke: string; name: string }> = {
+  heartRate: { stroke: 'hsl(var(--primary))', name: 'Heart Rate (bpm)' },
+  oxygenSaturation: { stroke: 'hsl(var(--secondary))', name: 'O₂ Sat (%)' },
+  temperature: { stroke: 'hsl(var(--warning))', name: 'Temp (°C)' },
+  systolic: { stroke: 'hsl(var(--destructive))', name: 'Systolic (mmHg)' },
+  diastolic: { stroke: 'hsl(var(--success))', name: 'Diastolic (mmHg)' },
+  glucose: { stroke: 'hsl(var(--accent-foreground))', name: 'Glucose (mg/dL)' },
+  bloodGlucose: { stroke: 'hsl(var(--accent-foreground))', name: 'Blood Glucose (mg/dL)' },
+};
+
+// Transform vitals data for recharts
+const buildChartData = (vitals: Vitals[]) =>
+  vitals
+    .slice(0, 14) // Last 14 readings for clarity
+    .reverse()
+    .map((vital) => ({
+      date: format(new Date(vital.timestamp), 'MM/dd'),
+      heartRate: vital.heartRate,
+      oxygenSaturation: vital.oxygenSaturation,
+      temperature: vital.temperature,
+      systolic: vital.bloodPressureSystolic,
+      diastolic: vital.bloodPressureDiastolic,
+      glucose: vital.bloodGlucose,
+      bloodGlucose: vital.bloodGlucose,
+    }));
+
+type ChartRow = ReturnType<typeof buildChartData>[number];
+
+// The patient profile draws several charts over the same readings; build the
+// rows once per vitals array and let every chart share them
+const chartDataCache = new WeakMap<Vitals[], ChartRow[]>();
+
+const getChartData = (vitals: Vitals[]): ChartRow[] => {
+  if (!vitals || vitals.length === 0) return [];
+
+  let rows = chartDataCache.get(vitals);
+  if (!rows) {
+    rows = buildChartData(vitals);
+    chartDataCache.set(vitals, rows);
+  }
+  return rows;
+};
+
 // Using memo to prevent unnecessary re-renders during chart updates
 export const VitalsChart = memo(({ vitals, dataKeys = ['heartRate', 'oxygenSaturation'], height = 300 }: VitalsChartProps) => {
-  // Transform vitals data for recharts with memoization for performance
-  const chartData = useMemo(() => {
-    if (!vitals || vitals.length === 0) return [];
-    
-    return vitals
-      .slice(0, 14) // Last 14 readings for clarity
-      .reverse()
-      .map((vital) => ({
-        date: format(new Date(vital.timestamp), 'MM/dd'),
-        heartRate: vital.heartRate,
-        oxygenSaturation: vital.oxygenSaturation,
-        temperature: vital.temperature,
-        systolic: vital.bloodPressureSystolic,
-        diastolic: vital.bloodPressureDiastolic,
-        glucose: vital.bloodGlucose,
-        bloodGlucose: vital.bloodGlucose,
-      }));
-  }, [vitals]);
-
-  const lineConfig = {
-    heartRate: { stroke: 'hsl(var(--primary))', name: 'Heart Rate (bpm)' },
-    oxygenSaturation: { stroke: 'hsl(var(--secondary))', name: 'O₂ Sat (%)' },
-    temperature: { stroke: 'hsl(var(--warning))', name: 'Temp (°C)' },
-    systolic: { stroke: 'hsl(var(--destructive))', name: 'Systolic (mmHg)' },
-    diastolic: { stroke: 'hsl(var(--success))', name: 'Diastolic (mmHg)' },
-    glucose: { stroke: 'hsl(var(--accent-foreground))', name: 'Glucose (mg/dL)' },
-    bloodGlucose: { stroke: 'hsl(var(--accent-foreground))', name: 'Blood Glucose (mg/dL)' },
-  };
+  const chartData = useMemo(() => getChartData(vitals), [vitals]);
 
   return (
     <ResponsiveContainer width="100%" height={height}>
@@ -74,8 +90,8 @@ export const VitalsChart = memo(({ vitals, dataKeys = ['heartRate', 'oxygenSatur
             key={key as string}
             type="monotone"
             dataKey={key as string}
-            stroke={lineConfig[key as keyof typeof lineConfig]?.stroke}
-            name={lineConfig[key as keyof typeof lineConfig]?.name}
+            stroke={LINE_CONFIG[key]?.stroke}
+            name={LINE_CONFIG[key]?.name}
             strokeWidth={2}
             dot={{ r: 3 }}
             activeDot={{ r: 5 }}
@@ -1,6 +1,6 @@
 // Avatar upload dialog component
 
-import React, { useState, useCallback } from 'react';
+import React, { useState, useCallback, useEffect } from 'react';
 import { Dialog, DialogContent, DialogDescription, DialogHeader, DialogTitle } from '@/components/ui/dialog';
 import { Button } from '@/components/ui/button';
 import { toast } from 'sonner';
@@ -8,6 +8,29 @@ import { Upload, X } from 'lucide-react';
 import { authService } from '@/services/authService';
 import { useAuth } from '@/contexts/AuthContext';
 
+// Leading bytes of the common image formats, keyed by declared MIME type.
+// Every part must match (WebP is a RIFF container with a WEBP tag at byte 8).
+const IMAGE_SIGNATURES: Record<string, { offset: number; bytes: number[] }[]> = {
+  'image/png': [{ offset: 0, bytes: [0x89, 0x50, 0x4e, 0x47] }],
+  'image/jpeg': [{ offset: 0, bytes: [0xff, 0xd8, 0xff] }],
+  'image/gif': [{ offset: 0, bytes: [0x47, 0x49, 0x46, 0x38] }],
+  'image/webp': [
+    { offset: 0, bytes: [0x52, 0x49, 0x46, 0x46] },
+    { offset: 8, bytes: [0x57, 0x45, 0x42, 0x50] },
+  ],
+};
+const SIGNATURE_LENGTH = 12;
+
+// Check a file's header against its declared type. Only the first few bytes
+// are read, so a mislabelled file is rejected before it is loaded or uploaded.
+const hasImageSignature = async (file: File): Promise<boolean> => {
+  const parts = IMAGE_SIGNATURES[file.type];
+  if (!parts) return true; // Other image types are left to the server
+
+  const head = new Uint8Array(await file.slice(0, SIGNATURE_LENGTH).arrayBuffer());
+  return parts.every(({ offset, bytes }) => bytes.every((byte, i) => head[offset + i] === byte));
+};
+
 interface AvatarUploadDialogProps {
   open: boolean;
   onOpenChange: (open: boolean) => void;
@@ -19,7 +42,7 @@ export const AvatarUploadDialog = React.memo<AvatarUploadDialogProps>(({ open, o
   const [selectedFile, setSelectedFile] = useState<File | null>(null);
   const [isUploading, setIsUploading] = useState(false);
 
-  const handleFileChange = useCallback((e: React.ChangeEvent<HTMLInputElement>) => {
+  const handleFileChange = useCallback(async (e: React.ChangeEvent<HTMLInputElement>) => {
     const file = e.target.files?.[0];
     if (!file) return;
 
@@ -33,14 +56,23 @@ export const AvatarUploadDialog = React.memo<AvatarUploadDialogProps>(({ open, o
       return;
     }
 
+    if (!(await hasImageSignature(file))) {
+      toast.error('File contents do not match an image format');
+      return;
+    }
+
     setSelectedFile(file);
-    const reader = new FileReader();
-    reader.onload = () => {
-      setPreview(reader.result as string);
-    };
-    reader.readAsDataURL(file);
+    // An object URL points at the file in place; a data: URL would read the
+    // whole image into memory and hold a base64 copy a third larger in state
+    setPreview(URL.createObjectURL(file));
   }, []);
 
+  // Release the object URL once the preview is replaced or the dialog unmounts
+  useEffect(() => {
+    if (!preview) return;
+    return () => URL.revokeObjectURL(preview);
+  }, [preview]);
+
   const handleUpload = useCallback(async () => {
     if (!preview || !selectedFile) return;
 
@@ -32,6 +32,12 @@ interface DashboardData {
   error: Error | null;
 }
 
+// Auto-refresh cadence while the dashboard is on screen
+const REFRESH_INTERVAL_MS = 5 * 60 * 1000;
+
+// Patients shown in the critical alerts panel
+const CRITICAL_LIST_SIZE = 10;
+
 export const useDashboardData = (): DashboardData => {
   const [isLoading, setIsLoading] = useState(true);
   const [error, setError] = useState<Error | null>(null);
@@ -68,18 +74,26 @@ export const useDashboardData = (): DashboardData => {
   const [recentActivity] = useState<ActivityEvent[]>([]);
 
   useEffect(() => {
+    let lastFetchedAt = 0;
+
     const fetchDashboardData = async () => {
+      lastFetchedAt = Date.now();
       try {
         setIsLoading(true);
         logger.info('Fetching dashboard data');
 
         // Fetch all dashboard data in parallel
-        const [statsData, kpisData, riskData, vitalsData, patientsData] = await Promise.all([
+        // Critical alerts only need the top few critical/high-risk patients;
+        // let the API filter by risk level rather than pulling 100 patients
+        const [statsData, kpisData, riskData, vitalsData, criticalData, highRiskData] = await Promise.all([
           dashboardService.getDashboardStats(),
           dashboardService.getKPIMetrics(),
           dashboardService.getRiskDistribution(),
           dashboardService.getVitalsTrends(),
-          patientService.getPatients({ page: 1, pageSize: 100 }).catch(() => ({ patients: [] })),
+          patientService.getPatients({ page: 1, pageSize: CRITICAL_LIST_SIZE, riskLevel: 'critical' })
+            .catch(() => ({ patients: [] as Patient[] })),
+          patientService.getPatients({ page: 1, pageSize: CRITICAL_LIST_SIZE, riskLevel: 'high' })
+            .catch(() => ({ patients: [] as Patient[] })),
         ]);
 
         // Transform and set data
@@ -88,11 +102,10 @@ export const useDashboardData = (): DashboardData => {
         setRiskDistribution(riskData.distribution);
         setVitalsTrends(dashboardService.transformVitalsTrends(vitalsData));
 
-        // Get critical patients (high + critical risk)
-        const critical = patientsData.patients
-          .filter((p: Patient) => p.riskLevel === 'critical' || p.riskLevel === 'high')
-          .slice(0, 10);
-        setCriticalPatients(critical);
+        // Critical patients first, topped up with high-risk ones
+        setCriticalPatients(
+          [...criticalData.patients, ...highRiskData.patients].slice(0, CRITICAL_LIST_SIZE)
+        );
 
         logger.info('Dashboard data loaded successfully');
       } catch (err: any) {
@@ -105,10 +118,26 @@ export const useDashboardData = (): DashboardData => {
 
     fetchDashboardData();
 
-    // Auto-refresh every 5 minutes
-    const interval = setInterval(fetchDashboardData, 5 * 60 * 1000);
+    // Auto-refresh every 5 minutes, but only while the tab is visible; a
+    // backgrounded dashboard would otherwise keep polling every dashboard endpoint
+    const interval = setInterval(() => {
+      if (!document.hidden) {
+        fetchDashboardData();
+      }
+    }, REFRESH_INTERVAL_MS);
+
+    // Catch up once on return if a refresh was skipped while hidden
+    const handleVisibilityChange = () => {
+      if (!document.hidden && Date.now() - lastFetchedAt >= REFRESH_INTERVAL_MS) {
+        fetchDashboardData();
+      }
+    };
+    document.addEventListener('visibilitychange', handleVisibilityChange);
 
-    return () => clearInterval(interval);
+    return () => {
+      clearInterval(interval);
+      document.removeEventListener('visibilitychange', handleVisibilityChange);
+    };
   }, []);
 
   return {
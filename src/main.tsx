@@ -1,5 +1,21 @@
 import { createRoot } from "react-dom/client";
 import App from "./App.tsx";
+import { config } from "./config/environment";
 import "./index.css";
 
+// Warm the connection to the API origin while the app boots so the first
+// authenticated request doesn't pay the DNS + TCP + TLS handshake
+try {
+  const apiOrigin = new URL(config.apiBaseUrl).origin;
+  if (apiOrigin !== window.location.origin) {
+    const link = document.createElement("link");
+    link.rel = "preconnect";
+    link.href = apiOrigin;
+    link.crossOrigin = "anonymous";
+    document.head.appendChild(link);
+  }
+} catch {
+  // Relative or malformed base URL - nothing to preconnect to
+}
+
 createRoot(document.getElementById("root")!).render(<App />);
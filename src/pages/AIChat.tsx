@@ -97,8 +97,43 @@ const AIChat = React.memo(() => {
     setIsStreaming(true);
 
     let assistantContent = '';
+    let flushFrame: number | null = null;
     const assistantId = crypto.randomUUID();
 
+    // Tokens arrive far faster than the screen refreshes, so publish the
+    // accumulated reply at most once per frame instead of once per token
+    const flushAssistant = () => {
+      flushFrame = null;
+      setMessages(prev => {
+        const lastMsg = prev[prev.length - 1];
+        if (lastMsg?.role === 'assistant' && lastMsg.id === assistantId) {
+          // The streaming reply is always last: swap that entry in place of
+          // mapping and comparing ids across the whole conversation. The
+          // slice still copies the array, so this only trims per-flush work
+          const next = prev.slice();
+          next[next.length - 1] = { ...lastMsg, content: assistantContent };
+          return next;
+        } else {
+          // Add new assistant message
+          return [...prev, {
+            id: assistantId,
+            role: 'assistant',
+            content: assistantContent,
+            created_at: new Date().toISOString(),
+          }];
+        }
+      });
+    };
+
+    // Publish any tokens still waiting on a frame so the reply is complete
+    // (and committed even in a hidden tab) by the time streaming ends
+    const flushPending = () => {
+      if (flushFrame !== null) {
+        cancelAnimationFrame(flushFrame);
+        flushAssistant();
+      }
+    };
+
     try {
       await chatService.streamMessage(
         { message: userMessage.content, conversation_id: conversationId },
@@ -106,29 +141,14 @@ const AIChat = React.memo(() => {
         // onToken
         (token: string) => {
           assistantContent += token;
-          setMessages(prev => {
-            const lastMsg = prev[prev.length - 1];
-            if (lastMsg?.role === 'assistant' && lastMsg.id === assistantId) {
-              // Update existing assistant message
-              return prev.map(m => 
-                m.id === assistantId 
-                  ? { ...m, content: assistantContent }
-                  : m
-              );
-            } else {
-              // Add new assistant message
-              return [...prev, {
-                id: assistantId,
-                role: 'assistant',
-                content: assistantContent,
-                created_at: new Date().toISOString(),
-              }];
-            }
-          });
+          if (flushFrame === null) {
+            flushFrame = requestAnimationFrame(flushAssistant);
+          }
         },
         
         // onDone
         (newConversationId: string) => {
+          flushPending();
           if (newConversationId) {
             setConversationId(newConversationId);
           }
@@ -137,6 +157,7 @@ const AIChat = React.memo(() => {
         
         // onError
         (error: string) => {
+          flushPending();
           toast({
             title: 'Error',
             description: error,
@@ -146,6 +167,7 @@ const AIChat = React.memo(() => {
         }
       );
     } catch (error: any) {
+      flushPending();
       logger.error('Failed to send message', error);
       setIsStreaming(false);
     }
@@ -10,7 +10,7 @@ import { EditPatientDialog } from '@/components/EditPatientDialog';
 import { BMIIndicator } from '@/components/BMIIndicator';
 import { MedicationTable } from '@/components/MedicationTable';
 import { VisitHistoryTable } from '@/components/VisitHistoryTable';
-import { VitalsChart } from '@/components/VitalsChart';
+import { VitalsChart, type ChartDataKey } from '@/components/VitalsChart';
 import { AddVitalReadingForm } from '@/components/AddVitalReadingForm';
 import { patientService } from '@/services/patientService';
 import { ArrowLeft, Clock } from 'lucide-react';
@@ -19,6 +19,25 @@ import { logger } from '@/utils/logger';
 import { toast } from 'sonner';
 import { Patient, Visit, Medication, Vitals, VitalResponse, MedicationResponse, VisitResponse } from '@/types/patient';
 
+// Transform backend vitals to the frontend model
+const toVitals = (v: VitalResponse): Vitals => ({
+  id: v.id,
+  timestamp: new Date(v.timestamp),
+  bloodPressureSystolic: v.blood_pressure_systolic,
+  bloodPressureDiastolic: v.blood_pressure_diastolic,
+  heartRate: v.heart_rate,
+  temperature: v.temperature,
+  oxygenSaturation: v.oxygen_saturation,
+  bloodGlucose: v.blood_glucose,
+});
+
+// Stable series selections so the memoised charts skip re-rendering when
+// unrelated profile state changes
+const CARDIO_KEYS: ChartDataKey[] = ['heartRate', 'oxygenSaturation'];
+const BLOOD_PRESSURE_KEYS: ChartDataKey[] = ['systolic', 'diastolic'];
+const TEMPERATURE_KEYS: ChartDataKey[] = ['temperature'];
+const GLUCOSE_KEYS: ChartDataKey[] = ['bloodGlucose'];
+
 const PatientProfile = () => {
   const { id } = useParams<{ id: string }>();
   const [activeTab, setActiveTab] = useState('overview');
@@ -34,27 +53,20 @@ const PatientProfile = () => {
 
     try {
       setIsLoading(true);
-      const patientData = await patientService.getPatientById(id);
-      setPatient(patientData);
 
-      // Fetch related data
-      const [vitalsData, medicationsData, visitsData] = await Promise.all([
+      // The related lists only need the route id, so fetch them alongside the
+      // patient record instead of waiting for it first
+      const [patientData, vitalsData, medicationsData, visitsData] = await Promise.all([
+        patientService.getPatientById(id),
         patientService.getPatientVitals(id).catch(() => []),
         patientService.getPatientMedications(id, false).catch(() => []),
         patientService.getPatientVisits(id).catch(() => []),
       ]);
 
+      setPatient(patientData);
+
       // Transform vitals
-      setVitals(vitalsData.map((v: VitalResponse) => ({
-        id: v.id,
-        timestamp: new Date(v.timestamp),
-        bloodPressureSystolic: v.blood_pressure_systolic,
-        bloodPressureDiastolic: v.blood_pressure_diastolic,
-        heartRate: v.heart_rate,
-        temperature: v.temperature,
-        oxygenSaturation: v.oxygen_saturation,
-        bloodGlucose: v.blood_glucose,
-      })));
+      setVitals(vitalsData.map(toVitals));
 
       // Transform medications
       setMedications(medicationsData.map((m: MedicationResponse) => ({
@@ -105,6 +117,31 @@ const PatientProfile = () => {
     fetchPatientData();
   };
 
+  // A new vital reading only affects the vitals list and possibly the
+  // patient's derived fields; medications and visits are unchanged, so skip
+  // re-fetching them and keep the page on screen while refreshing
+  const handleVitalAdded = async () => {
+    if (!id) return;
+
+    try {
+      const [patientData, vitalsData] = await Promise.all([
+        patientService.getPatientById(id),
+        patientService.getPatientVitals(id),
+      ]);
+      setPatient(patientData);
+      setVitals(vitalsData.map(toVitals));
+    } catch (error: any) {
+      logger.error('Failed to refresh vitals', error);
+      toast.error(error.response?.data?.detail || 'Failed to refresh vitals');
+    }
+  };
+
+  // The PATCH response already carries the updated record, so there is no
+  // need to re-fetch the patient and all three related lists
+  const handlePatientUpdated = (updated: Patient) => {
+    setPatient(updated);
+  };
+
   if (isLoading) {
     return (
       <div className="space-y-4 p-4 max-w-[1400px] mx-auto animate-pulse">
@@ -150,7 +187,7 @@ const PatientProfile = () => {
           <h1 className="text-xl font-bold text-foreground">{patient.name}</h1>
           <p className="text-xs text-muted-foreground">Patient ID: {patient.id}</p>
         </div>
-        <EditPatientDialog patient={patient} onSuccess={handleUpdate} />
+        <EditPatientDialog patient={patient} onSuccess={handlePatientUpdated} />
       </div>
 
       <div className="grid grid-cols-1 lg:grid-cols-4 gap-4">
@@ -244,7 +281,7 @@ const PatientProfile = () => {
             {/* Vitals Tab */}
             <TabsContent value="vitals" className="space-y-4 mt-4">
               {/* Add Vital Reading */}
-              <AddVitalReadingForm patientId={patient.id} onSuccess={handleUpdate} />
+              <AddVitalReadingForm patientId={patient.id} onSuccess={handleVitalAdded} />
 
               {vitals.length === 0 ? (
                 <Card className="medical-card">
@@ -262,7 +299,7 @@ const PatientProfile = () => {
                     <CardContent>
                       <VitalsChart 
                         vitals={vitals} 
-                        dataKeys={['heartRate', 'oxygenSaturation']}
+                        dataKeys={CARDIO_KEYS}
                         height={240}
                       />
                     </CardContent>
@@ -275,7 +312,7 @@ const PatientProfile = () => {
                     <CardContent>
                       <VitalsChart 
                         vitals={vitals} 
-                        dataKeys={['systolic', 'diastolic']}
+                        dataKeys={BLOOD_PRESSURE_KEYS}
                         height={240}
                       />
                     </CardContent>
@@ -288,7 +325,7 @@ const PatientProfile = () => {
                     <CardContent>
                       <VitalsChart 
                         vitals={vitals} 
-                        dataKeys={['temperature']}
+                        dataKeys={TEMPERATURE_KEYS}
                         height={240}
                       />
                     </CardContent>
@@ -302,7 +339,7 @@ const PatientProfile = () => {
                       <CardContent>
                         <VitalsChart 
                           vitals={vitals} 
-                          dataKeys={['bloodGlucose']}
+                          dataKeys={GLUCOSE_KEYS}
                           height={240}
                         />
                       </CardContent>
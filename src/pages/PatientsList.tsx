@@ -15,6 +15,7 @@ import { Link } from 'react-router-dom';
 import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue } from '@/components/ui/select';
 import { toast } from 'sonner';
 import { logger } from '@/utils/logger';
+import { useDebounce } from '@/hooks/useDebounce';
 import { Patient } from '@/types/patient';
 
 const PatientsList = () => {
@@ -27,6 +28,9 @@ const PatientsList = () => {
   const [totalPatients, setTotalPatients] = useState(0);
   const [totalPages, setTotalPages] = useState(0);
 
+  // Each search hits the server-side fuzzy match; wait for typing to pause
+  const debouncedSearch = useDebounce(searchQuery.trim(), 300);
+
   // Fetch patients from backend
   const fetchPatients = async () => {
     try {
@@ -34,7 +38,7 @@ const PatientsList = () => {
       const response = await patientService.getPatients({
         page: currentPage,
         pageSize: 50,
-        search: searchQuery || undefined,
+        search: debouncedSearch || undefined,
         status: statusFilter !== 'all' ? statusFilter : undefined,
         riskLevel: riskFilter !== 'all' ? riskFilter : undefined,
       });
@@ -53,7 +57,7 @@ const PatientsList = () => {
   // Fetch on mount and when filters/page change
   useEffect(() => {
     fetchPatients();
-  }, [currentPage, searchQuery, statusFilter, riskFilter]);
+  }, [currentPage, debouncedSearch, statusFilter, riskFilter]);
 
   const handleRefresh = () => {
     setCurrentPage(1);
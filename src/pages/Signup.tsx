@@ -13,6 +13,13 @@ import { useAuth } from '@/contexts/AuthContext';
 import { toast } from 'sonner';
 import { MedicalSpecialty, type SignupFormData } from '@/types/auth';
 
+// Password strength rules, built once rather than on every keystroke
+const LOWERCASE = /[a-z]/;
+const UPPERCASE = /[A-Z]/;
+const DIGIT = /\d/;
+const SYMBOL = /[^a-zA-Z\d]/;
+const STRENGTH_LABELS = ['', 'Weak', 'Fair', 'Good', 'Strong'];
+
 export const Signup = React.memo(() => {
   const { signup } = useAuth();
   const navigate = useNavigate();
@@ -42,12 +49,11 @@ export const Signup = React.memo(() => {
     
     let strength = 0;
     if (password.length >= 8) strength++;
-    if (/[a-z]/.test(password) && /[A-Z]/.test(password)) strength++;
-    if (/\d/.test(password)) strength++;
-    if (/[^a-zA-Z\d]/.test(password)) strength++;
+    if (LOWERCASE.test(password) && UPPERCASE.test(password)) strength++;
+    if (DIGIT.test(password)) strength++;
+    if (SYMBOL.test(password)) strength++;
 
-    const labels = ['', 'Weak', 'Fair', 'Good', 'Strong'];
-    return { strength, label: labels[strength] };
+    return { strength, label: STRENGTH_LABELS[strength] };
   }, [formData.password]);
 
   const handleInputChange = useCallback((field: keyof SignupFormData) => (
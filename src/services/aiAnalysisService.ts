@@ -1,4 +1,5 @@
 import { httpClient } from './httpClient';
+import { dashboardService } from './dashboardService';
 import { API_ENDPOINTS } from '@/config/api';
 import { logger } from '@/utils/logger';
 import type { AnalysisReport, AnalysisOptions } from '@/types/analysis';
@@ -169,6 +170,7 @@ export const aiAnalysisService = {
       requestBody,
       true
     );
+    dashboardService.invalidate();
 
     logger.info('AI analysis generated successfully', { reportId: response.report_id });
     return transformAnalysisReport(response);
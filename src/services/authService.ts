@@ -126,8 +126,8 @@ export const authService = {
     // Update user avatar in storage
     const user = tokenStorage.getUser();
     if (user) {
-      user.avatar_url = response.avatar_url;
-      tokenStorage.setUser(user);
+      // Store a copy: the cached user is shared with AuthContext state
+      tokenStorage.setUser({ ...user, avatar_url: response.avatar_url });
     }
 
     return response;
@@ -12,64 +12,68 @@ export const chatService = {
     onDone: (conversationId: string) => void,
     onError: (error: string) => void
   ): Promise<void> {
-    const token = tokenStorage.getAccessToken();
-    if (!token) {
+    if (!tokenStorage.getAccessToken()) {
       throw new Error('Authentication required');
     }
 
     try {
       logger.debug('Starting SSE stream for chat message');
 
-      const response = await fetch(API_ENDPOINTS.chat.send, {
-        method: 'POST',
-        headers: {
-          'Content-Type': 'application/json',
-          'Authorization': `Bearer ${token}`,
-        },
-        body: JSON.stringify(request),
-      });
-
-      if (!response.ok) {
-        const errorData = await response.json().catch(() => ({}));
-        throw new Error(errorData.detail || `HTTP ${response.status}`);
-      }
-
-      const reader = response.body?.getReader();
+      const reader = await httpClient.postStream(API_ENDPOINTS.chat.send, request, true);
       const decoder = new TextDecoder();
 
-      if (!reader) {
-        throw new Error('Response body is not readable');
-      }
+      // Returns true once a terminal (done/error) event has been handled
+      const handleLine = (line: string): boolean => {
+        if (!line.trim() || !line.startsWith('data: ')) return false;
+
+        const data = line.slice(6).trim();
+        if (!data) return false;
 
-      while (true) {
+        try {
+          const event: StreamEvent = JSON.parse(data);
+
+          if (event.type === 'token' && event.content) {
+            onToken(event.content);
+          } else if (event.type === 'error' && event.content) {
+            onError(event.content);
+            return true;
+          } else if (event.type === 'done') {
+            onDone(event.conversation_id || '');
+            return true;
+          }
+        } catch (parseError) {
+          logger.error('Failed to parse SSE event', parseError);
+        }
+        return false;
+      };
+
+      // Network chunks don't respect SSE line boundaries, so scan the decoded
+      // text for newlines and carry any trailing partial line into the next read
+      let buffer = '';
+      let finished = false;
+
+      while (!finished) {
         const { done, value } = await reader.read();
         if (done) break;
 
-        const chunk = decoder.decode(value, { stream: true });
-        const lines = chunk.split('\n');
-
-        for (const line of lines) {
-          if (!line.trim() || !line.startsWith('data: ')) continue;
-
-          const data = line.slice(6).trim();
-          if (!data) continue;
-
-          try {
-            const event: StreamEvent = JSON.parse(data);
-
-            if (event.type === 'token' && event.content) {
-              onToken(event.content);
-            } else if (event.type === 'error' && event.content) {
-              onError(event.content);
-              break;
-            } else if (event.type === 'done') {
-              onDone(event.conversation_id || '');
-              break;
-            }
-          } catch (parseError) {
-            logger.error('Failed to parse SSE event', parseError);
-          }
+        buffer += decoder.decode(value, { stream: true });
+
+        let lineStart = 0;
+        let newlineIndex = buffer.indexOf('\n');
+        while (newlineIndex !== -1) {
+          finished = handleLine(buffer.slice(lineStart, newlineIndex));
+          lineStart = newlineIndex + 1;
+          if (finished) break;
+          newlineIndex = buffer.indexOf('\n', lineStart);
         }
+        buffer = buffer.slice(lineStart);
+      }
+
+      if (finished) {
+        reader.cancel().catch(() => undefined);
+      } else {
+        // Flush a final event that arrived without a trailing newline
+        handleLine(buffer + decoder.decode());
       }
 
       logger.debug('SSE stream completed');
@@ -2,7 +2,9 @@
 
 import { API_ENDPOINTS } from '@/config/api';
 import { httpClient } from './httpClient';
+import { tokenStorage } from './tokenStorage';
 import { logger } from '@/utils/logger';
+import { TTLCache } from '@/utils/ttlCache';
 import type {
   DashboardStats,
   KPIMetricsResponse,
@@ -12,6 +14,26 @@ import type {
   VitalTrend,
 } from '@/types/dashboard';
 
+// Dashboard aggregates move slowly; navigating back to the dashboard within
+// this window reuses the last responses instead of re-issuing every request.
+// The scheduled 5-minute refresh is always longer than this, so it still
+// hits the network.
+const DASHBOARD_CACHE_TTL_MS = 60 * 1000;
+const responseCache = new TTLCache<string, unknown>(DASHBOARD_CACHE_TTL_MS, 20);
+
+// GET through the short-lived cache, scoped to the signed-in user
+const cachedGet = async <T>(url: string): Promise<T> => {
+  const key = `${tokenStorage.getUser()?.id ?? ''} ${url}`;
+  const cached = responseCache.get(key);
+  if (cached !== undefined) {
+    return cached as T;
+  }
+
+  const data = await httpClient.get<T>(url, true);
+  responseCache.set(key, data);
+  return data;
+};
+
 export const dashboardService = {
   /**
    * Get comprehensive dashboard statistics
@@ -19,12 +41,9 @@ export const dashboardService = {
   async getDashboardStats(): Promise<DashboardStats> {
     logger.debug('Fetching dashboard stats');
     
-    const stats = await httpClient.get<DashboardStats>(
-      API_ENDPOINTS.dashboard.stats,
-      true
-    );
+    const stats = await cachedGet<DashboardStats>(API_ENDPOINTS.dashboard.stats);
 
-    logger.info('Dashboard stats fetched', stats);
+    logger.info('Dashboard stats fetched');
     return stats;
   },
 
@@ -34,12 +53,9 @@ export const dashboardService = {
   async getKPIMetrics(): Promise<KPIMetricsResponse> {
     logger.debug('Fetching KPI metrics');
     
-    const kpis = await httpClient.get<KPIMetricsResponse>(
-      API_ENDPOINTS.dashboard.kpis,
-      true
-    );
+    const kpis = await cachedGet<KPIMetricsResponse>(API_ENDPOINTS.dashboard.kpis);
 
-    logger.info('KPI metrics fetched', kpis);
+    logger.info('KPI metrics fetched', { count: kpis?.metrics?.length });
     return kpis;
   },
 
@@ -49,12 +65,9 @@ export const dashboardService = {
   async getRiskDistribution(): Promise<RiskDistribution> {
     logger.debug('Fetching risk distribution');
     
-    const distribution = await httpClient.get<RiskDistribution>(
-      API_ENDPOINTS.dashboard.riskDistribution,
-      true
-    );
+    const distribution = await cachedGet<RiskDistribution>(API_ENDPOINTS.dashboard.riskDistribution);
 
-    logger.info('Risk distribution fetched', distribution);
+    logger.info('Risk distribution fetched');
     return distribution;
   },
 
@@ -64,15 +77,19 @@ export const dashboardService = {
   async getVitalsTrends(): Promise<VitalsTrendsResponse> {
     logger.debug('Fetching vitals trends');
     
-    const trends = await httpClient.get<VitalsTrendsResponse>(
-      API_ENDPOINTS.dashboard.vitalsTrends,
-      true
-    );
+    const trends = await cachedGet<VitalsTrendsResponse>(API_ENDPOINTS.dashboard.vitalsTrends);
 
-    logger.info('Vitals trends fetched', trends);
+    logger.info('Vitals trends fetched', { count: trends?.sparklines?.length });
     return trends;
   },
 
+  /**
+   * Drop cached dashboard responses after patient data changes
+   */
+  invalidate(): void {
+    responseCache.clear();
+  },
+
   /**
    * Transform backend KPI metrics to frontend format
    */
@@ -4,6 +4,7 @@
 import { httpClient } from './httpClient';
 import { API_ENDPOINTS } from '@/config/api';
 import { logger } from '@/utils/logger';
+import { TTLCache } from '@/utils/ttlCache';
 import type {
   Drug,
   DrugSearchResult,
@@ -15,20 +16,40 @@ import type {
 } from '@/types/drug';
 import { InteractionSeverity, EvidenceLevel } from '@/types/drug';
 
+// Typeahead repeats the same queries constantly (backspacing, re-opening the
+// picker); the catalog changes rarely, so a few minutes of staleness is fine
+const SEARCH_CACHE_TTL_MS = 5 * 60 * 1000;
+
+// FDA labels are effectively static and each lookup is slow upstream (the API
+// proxies api.fda.gov), so keep them for the whole working session
+const FDA_INFO_CACHE_TTL_MS = 60 * 60 * 1000;
+
 class DrugService {
+  private searchCache = new TTLCache<string, Drug[]>(SEARCH_CACHE_TTL_MS, 200);
+  private fdaInfoCache = new TTLCache<string, FDADrugInfo>(FDA_INFO_CACHE_TTL_MS, 50);
+
   /**
    * Search drugs with fuzzy matching using backend API
    * @param query - Search query (min 2 characters)
    * @param limit - Maximum number of results
    */
   async searchDrugs(query: string, limit: number = 10): Promise<Drug[]> {
-    if (!query || query.length < 2) return [];
+    // The backend matches case-insensitively, so "Aspirin", "aspirin " and
+    // "ASPIRIN" are one search: normalise before caching and sending
+    const normalizedQuery = query?.trim().toLowerCase();
+    if (!normalizedQuery || normalizedQuery.length < 2) return [];
+
+    const cacheKey = `${limit}:${normalizedQuery}`;
+    const cached = this.searchCache.get(cacheKey);
+    if (cached) {
+      return cached;
+    }
 
     try {
-      logger.debug('Searching drugs', { query, limit });
+      logger.debug('Searching drugs', { query: normalizedQuery, limit });
 
       const params = new URLSearchParams({
-        q: query,
+        q: normalizedQuery,
         limit: limit.toString(),
       });
 
@@ -38,7 +59,9 @@ class DrugService {
       );
 
       // Transform backend response to frontend Drug model
-      return results.map(this.transformDrugResult);
+      const drugs = results.map(this.transformDrugResult);
+      this.searchCache.set(cacheKey, drugs);
+      return drugs;
     } catch (error: any) {
       logger.error('Failed to search drugs', error);
       throw new Error(error.message || 'Failed to search drugs');
@@ -80,6 +103,11 @@ class DrugService {
    * @param drugId - Drug ID
    */
   async getFDAInfo(drugId: string): Promise<FDADrugInfo> {
+    const cached = this.fdaInfoCache.get(drugId);
+    if (cached) {
+      return cached;
+    }
+
     try {
       logger.debug('Fetching FDA drug info', { drugId });
 
@@ -89,7 +117,9 @@ class DrugService {
       );
 
       // Transform backend response to frontend FDADrugInfo model
-      return this.transformFDAInfo(result);
+      const info = this.transformFDAInfo(result);
+      this.fdaInfoCache.set(drugId, info);
+      return info;
     } catch (error: any) {
       logger.error('Failed to fetch FDA info', error);
       throw new Error(error.message || 'Failed to fetch FDA drug information');
@@ -11,38 +11,132 @@ interface RequestConfig extends RequestInit {
   };
 }
 
+// Upper bound for a single backoff sleep, regardless of attempt number
+const MAX_RETRY_DELAY_MS = 30000;
+
+// Exponential backoff with "equal jitter": half the window is fixed, half is
+// random, so clients that failed together (e.g. on a cold start) don't all
+// retry in the same instant
+const backoffDelay = (baseDelay: number, attemptNumber: number): number => {
+  const ceiling = Math.min(MAX_RETRY_DELAY_MS, baseDelay * Math.pow(2, attemptNumber - 1));
+  return ceiling / 2 + Math.random() * (ceiling / 2);
+};
+
+// Parse a Retry-After header (delta-seconds or HTTP-date) into milliseconds
+const retryAfterDelay = (response: Response): number | null => {
+  const header = response.headers.get('retry-after');
+  if (!header) return null;
+
+  const seconds = Number(header);
+  if (!Number.isNaN(seconds)) {
+    return Math.min(MAX_RETRY_DELAY_MS, Math.max(0, seconds * 1000));
+  }
+
+  const date = Date.parse(header);
+  return Number.isNaN(date) ? null : Math.min(MAX_RETRY_DELAY_MS, Math.max(0, date - Date.now()));
+};
+
+const sleep = (ms: number) => new Promise(resolve => setTimeout(resolve, ms));
+
+// Error for non-2xx responses, carrying what the retry policy needs
+class HttpError extends Error {
+  status: number;
+  retryAfter: number | null;
+
+  constructor(message: string, status: number, retryAfter: number | null) {
+    super(message);
+    this.name = 'HttpError';
+    this.status = status;
+    this.retryAfter = retryAfter;
+  }
+}
+
+// Single retry policy for every request: rate limiting, server errors and
+// network failures are transient; anything else (4xx, timeouts) is final.
+// Returns the delay before the next attempt, or null when not retryable.
+const retryDelayFor = (error: any, baseDelay: number, attemptNumber: number): number | null => {
+  if (error instanceof HttpError) {
+    if (error.status !== 429 && error.status < 500) return null;
+    return error.retryAfter ?? backoffDelay(baseDelay, attemptNumber);
+  }
+
+  const message: string = error?.message || '';
+  if (message.includes('fetch') || message.includes('network')) {
+    return backoffDelay(baseDelay, attemptNumber);
+  }
+
+  return null;
+};
+
+// Extract the API's error message from a non-2xx response. Every transport
+// method (JSON, blob, form data, stream) goes through this one parser.
+const readErrorMessage = async (response: Response): Promise<string> => {
+  const errorData = await response.json().catch(() => ({}));
+
+  // Handle Pydantic validation errors (array of error objects)
+  if (Array.isArray(errorData.detail)) {
+    return errorData.detail
+      .map((err: any) => err.msg || err.message || String(err))
+      .join(', ');
+  }
+  if (typeof errorData.detail === 'string') {
+    return errorData.detail;
+  }
+  if (errorData.message) {
+    return errorData.message;
+  }
+  return `HTTP ${response.status}`;
+};
+
+// Static headers shared by every JSON request
+const JSON_HEADERS: Readonly<Record<string, string>> = { 'Content-Type': 'application/json' };
+
 class HttpClient {
+  // In-flight GET requests keyed by URL + auth mode. Concurrent callers asking
+  // for the same resource share one network round-trip instead of each
+  // issuing their own (e.g. dashboard + config panel both loading patients).
+  private inflight = new Map<string, Promise<unknown>>();
+
+  // Resolve relative API paths against the configured base URL
+  private resolveUrl(url: string): string {
+    return url.startsWith('http') ? url : `${API_BASE_URL}${url}`;
+  }
+
+  // Bearer header for the current session (empty when not required or logged out)
+  private authHeader(requiresAuth: boolean): Record<string, string> {
+    if (!requiresAuth) return {};
+    const token = tokenStorage.getAccessToken();
+    return token ? { Authorization: `Bearer ${token}` } : {};
+  }
+
+  // Perform a single attempt. Failures are thrown and classified by the
+  // shared retry policy in request().
   private async requestWithTimeout<T>(
     url: string,
     config: RequestConfig,
-    attemptNumber: number = 1
+    attemptNumber: number,
+    deadline: number
   ): Promise<T> {
     const { 
       requiresAuth = false, 
       headers = {}, 
-      timeout = 60000, // Default 60s timeout
-      retryConfig,
+      timeout: _timeout,
+      retryConfig: _retryConfig,
       ...restConfig 
     } = config;
 
     // Create AbortController for timeout
     const controller = new AbortController();
-    const timeoutId = setTimeout(() => controller.abort(), timeout);
+    const timeoutId = setTimeout(() => controller.abort(), Math.max(0, deadline - Date.now()));
 
     try {
       const requestHeaders: HeadersInit = {
-        'Content-Type': 'application/json',
+        ...JSON_HEADERS,
         ...headers,
+        ...this.authHeader(requiresAuth),
       };
 
-      if (requiresAuth) {
-        const token = tokenStorage.getAccessToken();
-        if (token) {
-          requestHeaders['Authorization'] = `Bearer ${token}`;
-        }
-      }
-
-      const fullUrl = url.startsWith('http') ? url : `${API_BASE_URL}${url}`;
+      const fullUrl = this.resolveUrl(url);
 
       logger.debug(`HTTP ${config.method || 'GET'} ${fullUrl} (attempt ${attemptNumber})`);
       
@@ -56,33 +150,9 @@ class HttpClient {
 
       // Handle error responses
       if (!response.ok) {
-        const errorData = await response.json().catch(() => ({}));
-        
-        // Handle Pydantic validation errors (array of error objects)
-        let errorMessage: string;
-        if (Array.isArray(errorData.detail)) {
-          errorMessage = errorData.detail
-            .map((err: any) => err.msg || err.message || String(err))
-            .join(', ');
-        } else if (typeof errorData.detail === 'string') {
-          errorMessage = errorData.detail;
-        } else if (errorData.message) {
-          errorMessage = errorData.message;
-        } else {
-          errorMessage = `HTTP ${response.status}`;
-        }
-        
+        const errorMessage = await readErrorMessage(response);
         logger.error(`HTTP Error: ${response.status} - ${errorMessage}`);
-        
-        // Retry logic for 5xx errors and network failures
-        if (retryConfig && attemptNumber < retryConfig.maxRetries && response.status >= 500) {
-          const delay = retryConfig.retryDelay * Math.pow(2, attemptNumber - 1); // Exponential backoff
-          logger.info(`Retrying in ${delay}ms... (attempt ${attemptNumber + 1}/${retryConfig.maxRetries})`);
-          await new Promise(resolve => setTimeout(resolve, delay));
-          return this.requestWithTimeout<T>(url, config, attemptNumber + 1);
-        }
-        
-        throw new Error(errorMessage);
+        throw new HttpError(errorMessage, response.status, retryAfterDelay(response));
       }
 
       // Handle 204 No Content - no body to parse
@@ -106,17 +176,11 @@ class HttpClient {
         logger.error('Request timed out', error);
         throw new Error('Server is taking longer than expected. Please try again.');
       }
-      
-      // Retry logic for network failures
-      if (retryConfig && attemptNumber < retryConfig.maxRetries && 
-          (error.message.includes('fetch') || error.message.includes('network'))) {
-        const delay = retryConfig.retryDelay * Math.pow(2, attemptNumber - 1);
-        logger.info(`Network error, retrying in ${delay}ms... (attempt ${attemptNumber + 1}/${retryConfig.maxRetries})`);
-        await new Promise(resolve => setTimeout(resolve, delay));
-        return this.requestWithTimeout<T>(url, config, attemptNumber + 1);
+
+      // HTTP errors were already logged above
+      if (!(error instanceof HttpError)) {
+        logger.error('HTTP request failed', error);
       }
-      
-      logger.error('HTTP request failed', error);
       throw error;
     }
   }
@@ -125,11 +189,47 @@ class HttpClient {
     url: string,
     config: RequestConfig = {}
   ): Promise<T> {
-    return this.requestWithTimeout<T>(url, config, 1);
+    const { timeout = 60000, retryConfig } = config; // Default 60s timeout
+
+    // The timeout is an overall budget shared by every retry attempt
+    const deadline = Date.now() + timeout;
+
+    for (let attemptNumber = 1; ; attemptNumber++) {
+      try {
+        return await this.requestWithTimeout<T>(url, config, attemptNumber, deadline);
+      } catch (error: any) {
+        const delay = retryConfig && attemptNumber < retryConfig.maxRetries
+          ? retryDelayFor(error, retryConfig.retryDelay, attemptNumber)
+          : null;
+
+        // Each attempt logs its own failure; only report skipped retries here
+        if (delay === null) {
+          throw error;
+        }
+
+        // Don't sleep past the budget only to time out on the next attempt
+        if (Date.now() + delay >= deadline) {
+          logger.warn('Retry skipped: not enough time left before the request deadline');
+          throw error;
+        }
+
+        logger.info(`Retrying in ${Math.round(delay)}ms... (attempt ${attemptNumber + 1}/${retryConfig.maxRetries})`);
+        await sleep(delay);
+      }
+    }
   }
 
   async get<T>(url: string, requiresAuth: boolean = false, timeout?: number): Promise<T> {
-    return this.request<T>(url, { method: 'GET', requiresAuth, timeout });
+    const key = `${requiresAuth ? 'auth' : 'anon'} ${url}`;
+    const pending = this.inflight.get(key);
+    if (pending) {
+      return pending as Promise<T>;
+    }
+
+    const promise = this.request<T>(url, { method: 'GET', requiresAuth, timeout })
+      .finally(() => this.inflight.delete(key));
+    this.inflight.set(key, promise);
+    return promise;
   }
 
   async post<T>(
@@ -162,16 +262,8 @@ class HttpClient {
 
   // Special method for blob responses (PDF downloads)
   async getBlob(url: string, requiresAuth: boolean = false): Promise<Blob> {
-    const requestHeaders: HeadersInit = {};
-
-    if (requiresAuth) {
-      const token = tokenStorage.getAccessToken();
-      if (token) {
-        requestHeaders['Authorization'] = `Bearer ${token}`;
-      }
-    }
-
-    const fullUrl = url.startsWith('http') ? url : `${API_BASE_URL}${url}`;
+    const requestHeaders: HeadersInit = this.authHeader(requiresAuth);
+    const fullUrl = this.resolveUrl(url);
 
     try {
       logger.debug(`HTTP GET (Blob) ${fullUrl}`);
@@ -182,8 +274,7 @@ class HttpClient {
       });
 
       if (!response.ok) {
-        const errorData = await response.json().catch(() => ({}));
-        const errorMessage = errorData.detail || `HTTP ${response.status}`;
+        const errorMessage = await readErrorMessage(response);
         logger.error(`HTTP Error: ${response.status} - ${errorMessage}`);
         throw new Error(errorMessage);
       }
@@ -197,14 +288,8 @@ class HttpClient {
 
   // Special method for multipart/form-data (avatar upload)
   async postFormData<T>(url: string, formData: FormData, requiresAuth: boolean = true): Promise<T> {
-    const token = tokenStorage.getAccessToken();
-    const headers: HeadersInit = {};
-
-    if (requiresAuth && token) {
-      headers['Authorization'] = `Bearer ${token}`;
-    }
-
-    const fullUrl = url.startsWith('http') ? url : `${API_BASE_URL}${url}`;
+    const headers: HeadersInit = this.authHeader(requiresAuth);
+    const fullUrl = this.resolveUrl(url);
 
     try {
       const response = await fetch(fullUrl, {
@@ -214,8 +299,7 @@ class HttpClient {
       });
 
       if (!response.ok) {
-        const errorData = await response.json().catch(() => ({}));
-        throw new Error(errorData.detail || `HTTP ${response.status}`);
+        throw new Error(await readErrorMessage(response));
       }
 
       return await response.json();
@@ -224,6 +308,34 @@ class HttpClient {
       throw error;
     }
   }
+
+  // Special method for streamed responses (chat SSE). Returns the body reader;
+  // the caller owns decoding and must release it when done.
+  async postStream(
+    url: string,
+    body: any,
+    requiresAuth: boolean = true
+  ): Promise<ReadableStreamDefaultReader<Uint8Array>> {
+    const fullUrl = this.resolveUrl(url);
+
+    logger.debug(`HTTP POST (Stream) ${fullUrl}`);
+
+    const response = await fetch(fullUrl, {
+      method: 'POST',
+      headers: { ...JSON_HEADERS, ...this.authHeader(requiresAuth) },
+      body: JSON.stringify(body),
+    });
+
+    if (!response.ok) {
+      throw new Error(await readErrorMessage(response));
+    }
+
+    const reader = response.body?.getReader();
+    if (!reader) {
+      throw new Error('Response body is not readable');
+    }
+    return reader;
+  }
 }
 
 export const httpClient = new HttpClient();
@@ -1,6 +1,7 @@
 // Patient data access layer with full backend integration
 
 import { httpClient } from './httpClient';
+import { dashboardService } from './dashboardService';
 import { API_ENDPOINTS } from '@/config/api';
 import { logger } from '@/utils/logger';
 import type {
@@ -92,6 +93,7 @@ export const patientService = {
   async createPatient(data: PatientCreate): Promise<Patient> {
     try {
       const response = await httpClient.post<PatientResponse>(API_ENDPOINTS.patients.create, data, true);
+      dashboardService.invalidate();
       logger.info('Created new patient', { patientId: response.id });
       return transformPatient(response);
     } catch (error) {
@@ -104,6 +106,7 @@ export const patientService = {
   async updatePatient(id: string, updates: PatientUpdate): Promise<Patient> {
     try {
       const response = await httpClient.patch<PatientResponse>(API_ENDPOINTS.patients.update(id), updates, true);
+      dashboardService.invalidate();
       logger.info('Updated patient', { patientId: id });
       return transformPatient(response);
     } catch (error) {
@@ -116,6 +119,7 @@ export const patientService = {
   async deletePatient(id: string): Promise<void> {
     try {
       await httpClient.delete(API_ENDPOINTS.patients.delete(id), true);
+      dashboardService.invalidate();
       logger.info('Deleted patient', { patientId: id });
     } catch (error) {
       logger.error('Failed to delete patient', { patientId: id, error });
@@ -131,6 +135,7 @@ export const patientService = {
         vital,
         true
       );
+      dashboardService.invalidate();
       logger.info('Added vital reading', { patientId, vitalId: response.id });
       return response;
     } catch (error) {
@@ -160,6 +165,7 @@ export const patientService = {
         medication,
         true
       );
+      dashboardService.invalidate();
       logger.info('Added medication', { patientId, medicationId: response.id });
       return response;
     } catch (error) {
@@ -189,6 +195,7 @@ export const patientService = {
         updates,
         true
       );
+      dashboardService.invalidate();
       logger.info('Updated medication', { medicationId });
       return response;
     } catch (error) {
@@ -201,6 +208,7 @@ export const patientService = {
   async discontinueMedication(medicationId: string): Promise<void> {
     try {
       await httpClient.delete(API_ENDPOINTS.medications.discontinue(medicationId), true);
+      dashboardService.invalidate();
       logger.info('Discontinued medication', { medicationId });
     } catch (error) {
       logger.error('Failed to discontinue medication', { medicationId, error });
@@ -216,6 +224,7 @@ export const patientService = {
         visit,
         true
       );
+      dashboardService.invalidate();
       logger.info('Recorded visit', { patientId, visitId: response.id });
       return response;
     } catch (error) {
@@ -42,7 +42,7 @@ export const settingsService = {
       true
     );
 
-    logger.info('User settings fetched', settings);
+    logger.info('User settings fetched');
     return settings;
   },
 
@@ -50,7 +50,7 @@ export const settingsService = {
    * Update user settings
    */
   async updateSettings(updates: BackendSettingsUpdate): Promise<BackendUserSettings> {
-    logger.debug('Updating user settings', updates);
+    logger.debug('Updating user settings', { fields: Object.keys(updates) });
     
     const settings = await httpClient.patch<BackendUserSettings>(
       API_ENDPOINTS.settings,
@@ -58,7 +58,7 @@ export const settingsService = {
       true
     );
 
-    logger.info('User settings updated', settings);
+    logger.info('User settings updated');
     return settings;
   },
 
@@ -73,7 +73,7 @@ export const settingsService = {
       true
     );
 
-    logger.info('Notification preferences fetched', prefs);
+    logger.info('Notification preferences fetched');
     return prefs;
   },
 };
@@ -7,9 +7,22 @@ const KEYS = {
   TOKEN_EXPIRY: 'meditrack_token_expiry',
 } as const;
 
+// In-memory mirror of the hot session entries. The access token is read on
+// every authenticated request and the user was re-parsed from JSON on each
+// read; localStorage is only consulted again after another tab changes it.
+// `undefined` means "not loaded yet", `null` means "no value stored".
+let cachedAccessToken: string | null | undefined;
+let cachedUser: any | null | undefined;
+
+window.addEventListener('storage', (event) => {
+  if (event.key === null || event.key === KEYS.ACCESS_TOKEN) cachedAccessToken = undefined;
+  if (event.key === null || event.key === KEYS.USER) cachedUser = undefined;
+});
+
 export const tokenStorage = {
   // Save tokens and calculate expiry time
   setTokens(accessToken: string, refreshToken: string, expiresInMinutes: number = 30) {
+    cachedAccessToken = accessToken;
     try {
       localStorage.setItem(KEYS.ACCESS_TOKEN, accessToken);
       localStorage.setItem(KEYS.REFRESH_TOKEN, refreshToken);
@@ -25,7 +38,10 @@ export const tokenStorage = {
   },
 
   getAccessToken(): string | null {
-    return localStorage.getItem(KEYS.ACCESS_TOKEN);
+    if (cachedAccessToken === undefined) {
+      cachedAccessToken = localStorage.getItem(KEYS.ACCESS_TOKEN);
+    }
+    return cachedAccessToken;
   },
 
   getRefreshToken(): string | null {
@@ -45,6 +61,7 @@ export const tokenStorage = {
   },
 
   setUser(user: any) {
+    cachedUser = user;
     try {
       localStorage.setItem(KEYS.USER, JSON.stringify(user));
       logger.debug('User saved to storage');
@@ -54,16 +71,22 @@ export const tokenStorage = {
   },
 
   getUser(): any | null {
+    if (cachedUser !== undefined) {
+      return cachedUser;
+    }
     try {
       const user = localStorage.getItem(KEYS.USER);
-      return user ? JSON.parse(user) : null;
+      cachedUser = user ? JSON.parse(user) : null;
     } catch (error) {
       logger.error('Failed to parse user', error);
-      return null;
+      cachedUser = null;
     }
+    return cachedUser;
   },
 
   clearAll() {
+    cachedAccessToken = null;
+    cachedUser = null;
     Object.values(KEYS).forEach(key => localStorage.removeItem(key));
     logger.debug('All tokens cleared from storage');
   },
@@ -4,6 +4,12 @@ import jsPDF from 'jspdf';
 import { format } from 'date-fns';
 import { Medication, Visit, Patient } from '@/types/patient';
 
+const WHITESPACE_RUN = /\s+/g;
+
+// Build a dated, filesystem-friendly PDF filename for a patient document
+const patientFileName = (prefix: string, patient: Patient): string =>
+  `${prefix}_${patient.name.replace(WHITESPACE_RUN, '_')}_${format(new Date(), 'yyyyMMdd')}.pdf`;
+
 /**
  * Export patient prescriptions to PDF
  */
@@ -114,7 +120,7 @@ export const exportPrescriptionsPDF = (
   doc.text('Signature', 20, yPos + 5);
   
   // Save
-  const fileName = `Prescription_${patient.name.replace(/\s+/g, '_')}_${format(new Date(), 'yyyyMMdd')}.pdf`;
+  const fileName = patientFileName('Prescription', patient);
   doc.save(fileName);
 };
 
@@ -248,6 +254,6 @@ export const exportVisitHistoryPDF = (
   doc.text(format(new Date(), 'MM/dd/yyyy'), pageWidth - 60, yPos + 6);
   
   // Save
-  const fileName = `VisitHistory_${patient.name.replace(/\s+/g, '_')}_${format(new Date(), 'yyyyMMdd')}.pdf`;
+  const fileName = patientFileName('VisitHistory', patient);
   doc.save(fileName);
 };
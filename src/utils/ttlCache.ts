@@ -0,0 +1,55 @@
+// Small in-memory LRU cache with per-entry expiry
+// Lets services skip repeat network calls for idempotent lookups
+
+interface CacheEntry<V> {
+  value: V;
+  expiresAt: number;
+}
+
+export class TTLCache<K, V> {
+  private entries = new Map<K, CacheEntry<V>>();
+  private ttlMs: number;
+  private maxSize: number;
+
+  /**
+   * @param ttlMs - How long an entry stays valid after being set
+   * @param maxSize - Maximum entries kept; least recently used are evicted first
+   */
+  constructor(ttlMs: number, maxSize: number = 100) {
+    this.ttlMs = ttlMs;
+    this.maxSize = maxSize;
+  }
+
+  get(key: K): V | undefined {
+    const entry = this.entries.get(key);
+    if (!entry) return undefined;
+
+    if (entry.expiresAt <= Date.now()) {
+      this.entries.delete(key);
+      return undefined;
+    }
+
+    // Map preserves insertion order, so re-inserting marks the entry most recent
+    this.entries.delete(key);
+    this.entries.set(key, entry);
+    return entry.value;
+  }
+
+  set(key: K, value: V): void {
+    this.entries.delete(key);
+    this.entries.set(key, { value, expiresAt: Date.now() + this.ttlMs });
+
+    if (this.entries.size > this.maxSize) {
+      const oldestKey = this.entries.keys().next().value as K;
+      this.entries.delete(oldestKey);
+    }
+  }
+
+  delete(key: K): void {
+    this.entries.delete(key);
+  }
+
+  clear(): void {
+    this.entries.clear();
+  }
+}